@@ -1,12 +1,13 @@
 # main.py
 import argparse
 import os
-from ..utils.wav_reader import read_wav_file
-from ..utils.wav_writer import write_wav_file
-from ..utils.plotter import plot_audio  
+import numpy as np
+from ..utils.wav_reader import read_audio_buffer
+from ..utils.wav_writer import write_audio_buffer
+from ..utils.result_cache import ResultCache
 from .wav_processors import AudioProcessor
 
-def setup_argument_parser():
+def setup_argument_parser(argv=None):
     parser = argparse.ArgumentParser(description='WAV File Editor CLI')
     parser.add_argument('input', help='Input WAV file path')
     parser.add_argument('output', help='Output WAV file path')
@@ -25,12 +26,15 @@ def setup_argument_parser():
     noise_group.add_argument('--noise-pattern', type=str, default=None,
                         help='WAV file containing noise pattern to remove')
     noise_group.add_argument('--noise-method', type=str, default='spectral_subtraction',
-                        choices=['spectral_subtraction'],
-                        help='Noise removal method to use')
+                        choices=['spectral_subtraction', 'minimum_statistics'],
+                        help='Noise removal method to use (minimum_statistics estimates '
+                             'the noise from the input and needs no --noise-pattern)')
     noise_group.add_argument('--alpha', type=float, default=2.0,
                         help='Oversubtraction factor for noise removal (higher = more noise reduction)')
     noise_group.add_argument('--beta', type=float, default=0.01,
                         help='Spectral floor for noise removal (higher = less musical noise)')
+    noise_group.add_argument('--noise-window', type=float, default=1.5,
+                        help='Seconds over which minimum_statistics tracks the noise floor')
     
     # Advanced options
     advanced_group = parser.add_argument_group('Advanced Options')
@@ -45,11 +49,22 @@ def setup_argument_parser():
     advanced_group.add_argument('--hop-size', type=int, default=512,
                         help='Hop size for spectral processing')
     
+    # Cache options
+    cache_group = parser.add_argument_group('Cache Options')
+    cache_group.add_argument('--cache-dir', type=str, default=None,
+                        help='Directory for caching processed results (disabled if not set)')
+    cache_group.add_argument('--cache-size', type=float, default=512.0,
+                        help='Maximum result cache size in megabytes')
+    
     # Plotting option
     parser.add_argument('--plot', action='store_true',
                         help='Plot original and processed audio waveforms')
                         
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+def uses_noise_removal(args):
+    """Check whether args request noise removal."""
+    return args.noise_pattern is not None or args.noise_method == 'minimum_statistics'
 
 def validate_arguments(args):
     if not os.path.exists(args.input):
@@ -58,8 +73,9 @@ def validate_arguments(args):
     
     # Check for processing option
     if (args.amplify is None and not args.normalize and 
-        args.anti_distort is None and args.noise_pattern is None):
-        print("Error: No processing option selected. Use --amplify, --normalize, --anti-distort, or --noise-pattern.")
+        args.anti_distort is None and not uses_noise_removal(args)):
+        print("Error: No processing option selected. Use --amplify, --normalize, --anti-distort, "
+              "--noise-pattern, or --noise-method minimum_statistics.")
         return False
     
     # Validate smoothing factor
@@ -71,113 +87,249 @@ def validate_arguments(args):
     if args.bands < 1:
         print("Error: Number of bands must be at least 1")
         return False
+    
+    # Validate noise window
+    if args.noise_window <= 0:
+        print("Error: Noise window must be greater than 0")
+        return False
+    
+    # Validate cache size
+    if args.cache_size <= 0:
+        print("Error: Cache size must be greater than 0")
+        return False
         
     return True
 
-def process_audio(processor, args, audio_data):
-    processed_data = audio_data
+def describe_effect_chain(args):
+    """
+    Describe the processing steps selected by args, in application order.
+    Used as part of the result cache key.
+    """
+    effect_chain = []
+    if args.amplify is not None:
+        effect_chain.append(('amplify', {'factor': args.amplify}))
+    if args.anti_distort is not None:
+        effect_chain.append(('anti_distortion', {'threshold': args.anti_distort}))
+    if args.normalize:
+        effect_chain.append(('normalize', {}))
+    if uses_noise_removal(args):
+        noise_parameters = {
+            'method': args.noise_method,
+            'alpha': args.alpha,
+            'beta': args.beta,
+            'fft_size': args.fft_size,
+            'hop_size': args.hop_size,
+        }
+        if args.noise_method == 'minimum_statistics':
+            noise_parameters['noise_window'] = args.noise_window
+        effect_chain.append(('remove_noise', noise_parameters))
+    return effect_chain
+
+def process_audio(processor, args, audio):
+    processed = audio
     processing_applied = False
     
     if args.amplify is not None:
         print(f"Amplifying by factor: {args.amplify}")
-        processed_data = processor.amplify(args.amplify)
+        processed = processor.amplify_buffer(args.amplify)
         processing_applied = True
     
     if args.anti_distort is not None:
         print(f"Anti-distortion amplification: {args.anti_distort}")
         print(f"Using smoothing factor: {args.smoothing}")
-        processed_data = processor.anti_distortion(
+        processed = processor.anti_distortion_buffer(
             args.anti_distort
         )
         processing_applied = True
     
     if args.normalize:
         print("Normalizing audio...")
-        processed_data = processor.normalize()
+        processed = processor.normalize_buffer()
         processing_applied = True
         
-    return processed_data, processing_applied
+    return processed, processing_applied
+
+# Number of noise profiles kept by get_noise_profile()
+MAX_NOISE_PROFILES = 16
 
-def handle_noise_removal(processor, args, processed_data):
+def get_noise_profile(processor, args, noise, noise_profiles):
+    """
+    Return the averaged noise spectrum for the noise pattern, reusing a profile
+    from noise_profiles (an OrderedDict used as an LRU cache of at most
+    MAX_NOISE_PROFILES entries) when the same file was already analysed.
+    """
+    stat = os.stat(args.noise_pattern)
+    profile_key = (os.path.abspath(args.noise_pattern), stat.st_mtime, stat.st_size,
+                   processor.buffer.bits_per_sample, args.fft_size, args.hop_size)
+    if profile_key in noise_profiles:
+        noise_profiles.move_to_end(profile_key)
+        return noise_profiles[profile_key]
+    
+    noise_profile = processor.estimate_noise_profile(noise, args.fft_size, args.hop_size)
+    noise_profiles[profile_key] = noise_profile
+    while len(noise_profiles) > MAX_NOISE_PROFILES:
+        noise_profiles.popitem(last=False)
+    return noise_profile
+
+def handle_online_noise_removal(processor, args):
+    if args.noise_pattern is not None:
+        print(f"Note: --noise-pattern is ignored by the {args.noise_method} method")
+    
+    print(f"Noise removal method: {args.noise_method}")
+    window_frames = max(int(args.noise_window * processor.buffer.sample_rate / args.hop_size), 1)
+    
+    processed = processor.remove_noise_buffer(
+        method=args.noise_method,
+        alpha=args.alpha,
+        beta=args.beta,
+        fft_size=args.fft_size,
+        hop_size=args.hop_size,
+        window_frames=window_frames
+    )
+    
+    return processed, True
+
+def handle_noise_removal(processor, args, processed, noise_profiles=None):
+    if args.noise_method == 'minimum_statistics':
+        return handle_online_noise_removal(processor, args)
+    
     if args.noise_pattern is None:
-        return processed_data, False
+        return processed, False
         
     if not os.path.exists(args.noise_pattern):
         print(f"Error: Noise pattern file '{args.noise_pattern}' does not exist.")
-        return processed_data, False
+        return processed, False
             
     print(f"Removing noise using pattern: {args.noise_pattern}")
     print(f"Noise removal method: {args.noise_method}")
     
     # Load the noise pattern
-    noise_header, noise_data = read_wav_file(args.noise_pattern)
+    noise = read_audio_buffer(args.noise_pattern)
+    noise_profile = None
+    if noise_profiles is not None:
+        noise_profile = get_noise_profile(processor, args, noise, noise_profiles)
     
     # Check if sample rates match
-    if noise_header['sample_rate'] != processor.header['sample_rate']:
-        print(f"Warning: Noise pattern sample rate ({noise_header['sample_rate']} Hz) "
-              f"does not match input file sample rate ({processor.header['sample_rate']} Hz).")
+    if noise.sample_rate != processor.buffer.sample_rate:
+        print(f"Warning: Noise pattern sample rate ({noise.sample_rate} Hz) "
+              f"does not match input file sample rate ({processor.buffer.sample_rate} Hz).")
         print("Resampling might be needed for optimal results.")
     
     # Apply noise removal
-    processed_data = processor.remove_noise(
-        noise_data,
+    processed = processor.remove_noise_buffer(
+        noise,
         method=args.noise_method,
         alpha=args.alpha,
         beta=args.beta,
         fft_size=args.fft_size,
-        hop_size=args.hop_size
+        hop_size=args.hop_size,
+        noise_profile=noise_profile
     )
     
-    return processed_data, True
+    return processed, True
 
-def display_audio_stats(audio_data, processed_data, header):
-    orig_max = max(abs(sample) for sample in audio_data)
-    proc_max = max(abs(sample) for sample in processed_data)
-    
+def max_amplitude(audio):
+    return int(np.abs(audio.samples.astype(np.int64)).max()) if audio.samples.size else 0
+
+def audio_stats(audio, processed):
+    """Collect the statistics shown after processing (also stored in the result cache)."""
+    return {
+        'original_max': max_amplitude(audio),
+        'processed_max': max_amplitude(processed),
+        'bits_per_sample': audio.bits_per_sample,
+        'sample_rate': audio.sample_rate,
+        'num_channels': audio.num_channels,
+        'duration': audio.duration,
+    }
+
+def display_audio_stats(stats):
     print("\nAudio Statistics:")
-    print(f"Original max amplitude: {orig_max}")
-    print(f"Processed max amplitude: {proc_max}")
-    print(f"Bit depth: {header['bits_per_sample']} bits")
-    print(f"Sample rate: {header['sample_rate']} Hz")
-    print(f"Number of channels: {header['num_channels']}")
-    print(f"Duration: {len(audio_data) / header['sample_rate']:.2f} seconds")
+    print(f"Original max amplitude: {stats['original_max']}")
+    print(f"Processed max amplitude: {stats['processed_max']}")
+    print(f"Bit depth: {stats['bits_per_sample']} bits")
+    print(f"Sample rate: {stats['sample_rate']} Hz")
+    print(f"Number of channels: {stats['num_channels']}")
+    print(f"Duration: {stats['duration']:.2f} seconds")
 
-def main():
-    args = setup_argument_parser()
+def run_job(args, cache=None, noise_profiles=None):
+    """
+    Run one processing job described by parsed command line arguments.
     
-    if not validate_arguments(args):
-        return
+    Args:
+        args: Parsed and validated arguments
+        cache: Optional ResultCache used to skip repeated jobs
+        noise_profiles: Optional OrderedDict used to reuse noise spectra between jobs
+    """
+    # Look up the cache first: a hit must not pay for decoding the input
+    cache_key = None
+    stats = None
+    if cache is not None:
+        noise_pattern = args.noise_pattern
+        if args.noise_method == 'minimum_statistics':
+            noise_pattern = None
+        elif noise_pattern is not None and not os.path.exists(noise_pattern):
+            noise_pattern = None
+        cache_key = cache.make_key(args.input, describe_effect_chain(args), noise_pattern)
+        stats = cache.fetch(cache_key, args.output)
     
-    try:
+    audio = processed = None
+    if stats is not None:
+        print(f"Cache hit: copied cached result to {args.output}")
+    else:
         print(f"Reading WAV file: {args.input}")
-        header, audio_data = read_wav_file(args.input)
+        audio = read_audio_buffer(args.input)
         
         # Create processor and load data
-        processor = AudioProcessor().load_data(header, audio_data)
+        processor = AudioProcessor().load_buffer(audio)
         
         # Apply audio processing
-        processed_data, processing_applied = process_audio(processor, args, audio_data)
+        processed, processing_applied = process_audio(processor, args, audio)
         
         # Handle noise removal if requested
-        noise_processed_data, noise_applied = handle_noise_removal(processor, args, processed_data)
-        processed_data = noise_processed_data
+        processed, noise_applied = handle_noise_removal(
+            processor, args, processed, noise_profiles)
         processing_applied = processing_applied or noise_applied
         
         if not processing_applied:
             print("Warning: No processing was applied. Output will be identical to input.")
         
         print(f"Writing to: {args.output}")
-        write_wav_file(args.output, header, processed_data)
-        print("Processing complete!")
-        
-        # Print stats about the processed audio
-        display_audio_stats(audio_data, processed_data, header)
+        write_audio_buffer(args.output, processed)
         
-        # Plot if requested
-        if args.plot:
-            plot_output = f"{args.output.rsplit('.', 1)[0]}_plot.png"  # e.g., output_plot.png
-            plot_audio(audio_data, processed_data, header['sample_rate'], plot_output)
+        stats = audio_stats(audio, processed)
+        if cache is not None:
+            cache.store(cache_key, args.output, stats)
+    print("Processing complete!")
+    
+    # Print stats about the processed audio
+    display_audio_stats(stats)
+    if cache is not None:
+        print(cache.summary())
+    
+    # Plot if requested
+    if args.plot:
+        # Imported lazily: matplotlib dominates startup time otherwise
+        from ..utils.plotter import plot_audio
+        if audio is None:
+            audio = read_audio_buffer(args.input)
+            processed = read_audio_buffer(args.output)
+        plot_output = f"{args.output.rsplit('.', 1)[0]}_plot.png"  # e.g., output_plot.png
+        plot_audio(audio.samples, processed.samples, audio.sample_rate, plot_output)
+
+def create_cache(args):
+    """Create the result cache requested by args, or None if caching is disabled."""
+    if args.cache_dir is None:
+        return None
+    return ResultCache(args.cache_dir, int(args.cache_size * 1024 * 1024))
 
+def main():
+    args = setup_argument_parser()
+    
+    if not validate_arguments(args):
+        return
+    
+    try:
+        run_job(args, create_cache(args))
     except Exception as e:
         print(f"Error: {e}")
 
@@ -0,0 +1,262 @@
+# server.py
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from .main import setup_argument_parser, validate_arguments, run_job, create_cache
+from .wav_processors import hanning_window
+
+# Per-worker state, populated by init_worker()
+_noise_profiles = None
+
+def init_worker(fft_size):
+    """
+    Warm up a worker process: import processing modules and prepare caches.
+    """
+    global _noise_profiles
+    _noise_profiles = OrderedDict()
+    hanning_window(fft_size)
+
+def warm_up():
+    """No-op job used to start worker processes ahead of the first request."""
+    return os.getpid()
+
+def execute_job(job_args):
+    """
+    Run one job in a worker process.
+
+    Args:
+        job_args: List of command line arguments, as accepted by main.py
+
+    Returns:
+        Dictionary with 'ok', 'log' and 'processing_time' keys
+    """
+    start_time = time.perf_counter()
+    log = io.StringIO()
+    ok = False
+    with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        try:
+            args = setup_argument_parser(job_args)
+            if validate_arguments(args):
+                run_job(args, create_cache(args), _noise_profiles)
+                ok = True
+        except SystemExit:
+            # argparse exits on invalid arguments; the message is already in the log
+            pass
+        except Exception as e:
+            print(f"Error: {e}")
+
+    return {
+        'ok': ok,
+        'log': log.getvalue(),
+        'processing_time': time.perf_counter() - start_time,
+    }
+
+class JobQueue:
+    """
+    Bounded job queue feeding a pool of warm worker processes.
+    """
+
+    # Attempts per job; a job is retried once on a fresh pool if a worker dies
+    MAX_ATTEMPTS = 2
+
+    def __init__(self, workers, max_pending, fft_size=2048):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.fft_size = fft_size
+        self.lock = threading.Lock()
+        self.pool_lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.pool_restarts = 0
+        self.total_latency = 0.0
+        self.executor = self._start_pool()
+
+    def _start_pool(self):
+        """Create a worker pool and start all workers so jobs don't pay process startup."""
+        # The pool may be rebuilt while request threads are running, and forking a
+        # multi-threaded process can deadlock the child, so workers are not forked
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                       initargs=(self.fft_size,),
+                                       mp_context=multiprocessing.get_context('forkserver'))
+        warm_up_jobs = [executor.submit(warm_up) for _ in range(self.workers)]
+        for job in warm_up_jobs:
+            job.result()
+        return executor
+
+    def _replace_pool(self, broken_executor):
+        """
+        Replace a pool that became unusable because a worker process died.
+        """
+        with self.pool_lock:
+            if self.executor is not broken_executor:
+                # Another request already replaced it
+                return
+            broken_executor.shutdown(wait=False)
+            self.executor = self._start_pool()
+            with self.lock:
+                self.pool_restarts += 1
+        print("Warning: a worker process died; the worker pool was restarted")
+
+    def _run(self, job_args):
+        """
+        Run a job on the pool, restarting the pool if a worker died.
+        """
+        for _ in range(self.MAX_ATTEMPTS):
+            with self.pool_lock:
+                executor = self.executor
+                try:
+                    future = executor.submit(execute_job, job_args)
+                except BrokenProcessPool:
+                    future = None
+            if future is not None:
+                try:
+                    return future.result()
+                except BrokenProcessPool:
+                    pass
+            self._replace_pool(executor)
+
+        return {'ok': False, 'log': "Error: worker process died while running the job\n",
+                'processing_time': 0.0}
+
+    def submit(self, job_args):
+        """
+        Run a job and wait for its result.
+
+        Returns:
+            Result dictionary, or None if the queue is full
+        """
+        with self.lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                return None
+            self.pending += 1
+            queue_depth = self.pending
+
+        submit_time = time.perf_counter()
+        try:
+            result = self._run(job_args)
+        except Exception as e:
+            result = {'ok': False, 'log': f"Error: {e}\n", 'processing_time': 0.0}
+        latency = time.perf_counter() - submit_time
+
+        with self.lock:
+            self.pending -= 1
+            if result['ok']:
+                self.completed += 1
+            else:
+                self.failed += 1
+            self.total_latency += latency
+
+        result['latency'] = latency
+        result['queue_time'] = max(latency - result['processing_time'], 0.0)
+        result['queue_depth'] = queue_depth
+        return result
+
+    def status(self):
+        """Return a snapshot of the queue counters."""
+        with self.lock:
+            finished = self.completed + self.failed
+            return {
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'queue_depth': self.pending,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'pool_restarts': self.pool_restarts,
+                'average_latency': self.total_latency / finished if finished else 0.0,
+            }
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP interface to the job queue.
+
+    POST /jobs   body: {"args": ["input.wav", "output.wav", "--amplify", "1.5"]}
+    GET  /status queue depth and job counters
+    """
+
+    def _send_json(self, status_code, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if status_code == 503:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != '/status':
+            self._send_json(404, {'error': 'Not found'})
+            return
+        self._send_json(200, self.server.job_queue.status())
+
+    def do_POST(self):
+        if self.path != '/jobs':
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            job = json.loads(self.rfile.read(length))
+            job_args = job['args']
+            if not isinstance(job_args, list) or not all(isinstance(a, str) for a in job_args):
+                raise ValueError("'args' must be a list of strings")
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {'error': f"Invalid job request: {e}"})
+            return
+
+        result = self.server.job_queue.submit(job_args)
+        if result is None:
+            self._send_json(503, {'error': 'Job queue is full',
+                                  'queue_depth': self.server.job_queue.status()['queue_depth']})
+            return
+
+        self._send_json(200 if result['ok'] else 422, result)
+
+def serve(host, port, workers, max_pending, fft_size=2048):
+    """
+    Start the processing server and block until interrupted.
+    """
+    job_queue = JobQueue(workers, max_pending, fft_size)
+    server = ThreadingHTTPServer((host, port), JobRequestHandler)
+    server.job_queue = job_queue
+
+    print(f"Serving on http://{host}:{port} with {workers} workers "
+          f"(max {max_pending} pending jobs)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Shutting down...")
+    finally:
+        server.server_close()
+        job_queue.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='WAV File Editor processing server')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8750, help='Port to listen on')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes')
+    parser.add_argument('--max-pending', type=int, default=64,
+                        help='Maximum queued and running jobs before rejecting new ones')
+    parser.add_argument('--fft-size', type=int, default=2048,
+                        help='FFT size to prepare windows for in each worker')
+
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.workers, args.max_pending, args.fft_size)
@@ -1,20 +1,267 @@
 from ..utils.wav_utils import get_bit_depth_range
+from ..utils.audio_buffer import AudioBuffer
+from collections import deque
+from functools import lru_cache
 import numpy as np
 
+@lru_cache(maxsize=16)
+def hanning_window(fft_size):
+    """
+    Return a cached, read-only Hanning window of the given size.
+    """
+    window = np.hanning(fft_size)
+    window.flags.writeable = False
+    return window
+
+# Number of samples scaled at a time by the fixed-point gain
+GAIN_BLOCK_SIZE = 65536
+
+# Gains are split into two 31-bit limbs so |sample| * limb fits in int64
+LIMB_BITS = 31
+LIMB_MASK = (1 << LIMB_BITS) - 1
+
+# Mantissa bits of float64, used to reproduce its rounding of sample * factor
+FLOAT_MANTISSA_BITS = 52
+
+def bit_length(values):
+    """
+    Vectorized int.bit_length() for non-negative int64 arrays.
+    """
+    lengths = np.zeros(values.shape, dtype=np.int64)
+    values = values.copy()
+    for step in (32, 16, 8, 4, 2, 1):
+        large = values >= (1 << step)
+        lengths[large] += step
+        values[large] >>= step
+    return lengths + (values > 0)
+
+def fixed_point_gain(factor):
+    """
+    Express a float gain as a fixed-point ratio gain / 2**shift with gain < 2**62.
+    
+    Returns:
+        Tuple of (gain, shift)
+    """
+    magnitude = abs(factor)
+    sign = -1 if factor < 0 else 1
+    if magnitude >= 1 << LIMB_BITS:
+        # Any non-zero sample saturates; this is the largest gain that can't overflow
+        return sign * ((1 << 62) - 1), LIMB_BITS
+    
+    numerator, denominator = magnitude.as_integer_ratio()
+    integer_bits = max(numerator // denominator, 1).bit_length()
+    shift = 62 - integer_bits
+    gain = (numerator << shift) // denominator
+    return sign * gain, shift
+
+def scale_samples(samples, gain, shift, min_value, max_value, dtype):
+    """
+    Multiply integer samples by gain / 2**shift using int64 arithmetic only.
+    Results are truncated toward zero like int(sample * factor) and clipped to
+    the sample range.
+    
+    Args:
+        samples: NumPy array of integer samples
+        gain: Signed fixed-point gain from fixed_point_gain()
+        shift: Number of fractional bits in gain (at least LIMB_BITS)
+        min_value: Minimum sample value for the bit depth
+        max_value: Maximum sample value for the bit depth
+        dtype: NumPy dtype of the returned samples
+        
+    Returns:
+        NumPy array of scaled samples
+    """
+    scaled = np.empty(len(samples), dtype=dtype)
+    gain_high = abs(gain) >> LIMB_BITS
+    gain_low = abs(gain) & LIMB_MASK
+    for start in range(0, len(samples), GAIN_BLOCK_SIZE):
+        block = samples[start:start + GAIN_BLOCK_SIZE].astype(np.int64)
+        magnitude = np.abs(block)
+        high = magnitude * gain_high
+        low = magnitude * gain_low
+        
+        # The product is high * 2**31 + low; split it at 2**shift
+        upper = high + (low >> LIMB_BITS)
+        truncated = upper >> (shift - LIMB_BITS)
+        remainder = ((upper & ((1 << (shift - LIMB_BITS)) - 1)) << LIMB_BITS) | (low & LIMB_MASK)
+        
+        # float64 rounds products within half an ulp below an integer up to it
+        # before int() truncates, so do the same to keep identical results.
+        # Results that survive clipping are below 2**31, which bounds the half
+        # ulp and leaves only a few candidates to check.
+        gap = (1 << shift) - remainder
+        near = np.flatnonzero(gap <= (1 << (shift + 31 - (FLOAT_MANTISSA_BITS + 1))))
+        if len(near):
+            half_ulp_exponent = (bit_length(truncated[near]) - 1 + shift
+                                 - (FLOAT_MANTISSA_BITS + 1))
+            half_ulp = np.left_shift(1, np.maximum(half_ulp_exponent, 0))
+            truncated[near] += (half_ulp_exponent >= 0) & (gap[near] <= half_ulp)
+        magnitude = truncated
+        
+        negative = (block < 0) != (gain < 0)
+        block = np.where(negative, -magnitude, magnitude)
+        scaled[start:start + GAIN_BLOCK_SIZE] = np.clip(block, min_value, max_value)
+    return scaled
+
+# Bit depths small enough to precompute the soft clipping curve for every sample value
+LOOKUP_TABLE_BIT_DEPTHS = (8, 16)
+
+def soft_clip_curve(samples, threshold, min_value, max_value):
+    """
+    Apply the anti-distortion transfer curve to an array of integer samples.
+    
+    Args:
+        samples: NumPy array of integer samples
+        threshold: Threshold level (0.0-1.0) where soft clipping begins
+        min_value: Minimum sample value for the bit depth
+        max_value: Maximum sample value for the bit depth
+        
+    Returns:
+        NumPy int64 array of processed samples
+    """
+    samples = np.asarray(samples, dtype=np.int64)
+    threshold_value = int(max_value * threshold)
+    processed = samples.copy()
+    
+    abs_samples = np.abs(samples)
+    mask = abs_samples > threshold_value
+    if not mask.any():
+        return processed
+    
+    # Normalize to 0-1 range
+    normalized = abs_samples[mask] / max_value
+    # Apply soft curve above threshold
+    above = normalized > threshold
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized[above] = threshold + (1 - threshold) * np.tanh(
+            (normalized[above] - threshold) / (1 - threshold))
+    # Scale back to sample range, truncating toward zero like int()
+    sign = np.where(samples[mask] > 0, 1, -1)
+    new_samples = np.trunc(sign * normalized * max_value)
+    
+    # Final clipping protection
+    processed[mask] = np.clip(new_samples, min_value, max_value)
+    return processed
+
+@lru_cache(maxsize=32)
+def soft_clip_table(bits_per_sample, threshold):
+    """
+    Return a cached, read-only table of the soft clipping curve for every sample
+    value of an 8-bit or 16-bit signal, indexed by sample - min_value.
+    """
+    min_value, max_value = get_bit_depth_range(bits_per_sample)
+    table = soft_clip_curve(np.arange(min_value, max_value + 1), threshold, min_value, max_value)
+    table = table.astype(np.int16)
+    table.flags.writeable = False
+    return table
+
+class MinimumStatisticsEstimator:
+    """
+    Online noise floor tracker using minimum statistics.
+    
+    The magnitude spectrum of each frame is smoothed over time, and the noise
+    floor is the minimum of the smoothed spectrum over the last window_frames
+    frames. Speech and music rarely fill every frequency bin for that long, so
+    the minimum follows the noise. The window is split into subwindows so each
+    update costs O(bins) instead of O(window_frames * bins).
+    
+    The first frame seeds the minimum, so when streaming, the estimate only
+    follows the noise once window_frames frames have been seen; until then any
+    signal at the start is treated as noise. Offline callers should feed the
+    opening frames once before processing them (see _remove_noise_online).
+    """
+    
+    def __init__(self, window_frames=96, subwindows=8, smoothing=0.7, bias=1.6):
+        """
+        Args:
+            window_frames: Number of frames the minimum is taken over
+            subwindows: Number of subwindows the window is split into
+            smoothing: Time smoothing factor for the magnitude spectrum (0.0-1.0)
+            bias: Compensation for the minimum underestimating the mean noise level
+        """
+        self.subwindow_frames = max(window_frames // subwindows, 1)
+        self.smoothing = smoothing
+        self.bias = bias
+        self.smoothed = None
+        self.current_min = None
+        self.frame_count = 0
+        self.subwindow_mins = deque(maxlen=subwindows)
+    
+    def update(self, magnitude):
+        """
+        Feed the magnitude spectrum of the next frame.
+        
+        Args:
+            magnitude: Magnitude spectrum of the frame
+            
+        Returns:
+            Estimated noise magnitude spectrum
+        """
+        if self.smoothed is None:
+            self.smoothed = magnitude.copy()
+            self.current_min = magnitude.copy()
+        else:
+            self.smoothed = self.smoothing * self.smoothed + (1 - self.smoothing) * magnitude
+            np.minimum(self.current_min, self.smoothed, out=self.current_min)
+        
+        noise_floor = self.current_min.copy()
+        for subwindow_min in self.subwindow_mins:
+            np.minimum(noise_floor, subwindow_min, out=noise_floor)
+        
+        # Start a new subwindow, dropping the oldest one once the window is full
+        self.frame_count += 1
+        if self.frame_count == self.subwindow_frames:
+            self.subwindow_mins.append(self.current_min)
+            self.current_min = self.smoothed.copy()
+            self.frame_count = 0
+        
+        return self.bias * noise_floor
+
 class AudioProcessor:
     """
     Class for processing WAV audio data with various effects.
+    
+    The *_buffer methods take and return AudioBuffer objects; the older methods
+    returning lists of interleaved samples wrap them for compatibility.
     """
     
     def __init__(self):
-        self.header = None
-        self.audio_data = None
+        self.buffer = None
         self.min_value = None
         self.max_value = None
+        self._header = None
+    
+    @property
+    def header(self):
+        """
+        Header dictionary describing the loaded audio: the dictionary passed to
+        load_data(), or a canonical PCM header built from the buffer when the
+        audio was loaded with load_buffer().
+        """
+        if self._header is not None:
+            return self._header
+        return self.buffer.to_header() if self.buffer is not None else None
+    
+    @property
+    def audio_data(self):
+        """Loaded samples as a list of interleaved ints (compatibility accessor)."""
+        return self.buffer.tolist() if self.buffer is not None else None
     
     def check_data(self):
-        if self.audio_data is None or self.header is None:
-            raise ValueError("No audio data loaded. Call load_data() first.")
+        if self.buffer is None:
+            raise ValueError("No audio data loaded. Call load_buffer() or load_data() first.")
+    
+    def load_buffer(self, buffer):
+        """
+        Load an AudioBuffer for processing.
+        
+        Args:
+            buffer: AudioBuffer holding the samples and their format
+        """
+        self.buffer = buffer
+        self._header = None
+        self.min_value, self.max_value = get_bit_depth_range(buffer.bits_per_sample)
+        return self
     
     def load_data(self, header, audio_data):
         """
@@ -22,14 +269,13 @@ class AudioProcessor:
         
         Args:
             header: Dictionary containing WAV file header information
-            audio_data: List of audio samples
+            audio_data: List of interleaved audio samples
         """
-        self.header = header
-        self.audio_data = audio_data
-        self.min_value, self.max_value = get_bit_depth_range(header['bits_per_sample'])
+        self.load_buffer(AudioBuffer.from_header(header, audio_data))
+        self._header = header
         return self
     
-    def amplify(self, factor):
+    def amplify_buffer(self, factor):
         """
         Amplify audio data by the given factor.
         
@@ -37,50 +283,64 @@ class AudioProcessor:
             factor: Amplification factor (1.0 = no change, 2.0 = twice as loud)
             
         Returns:
-            List of amplified audio samples
+            AudioBuffer of amplified audio samples
         """
         self.check_data()
         
-        amplified_data = []
-        for sample in self.audio_data:
-            new_sample = int(sample * factor)
-            
-            # Clipping protection
-            if new_sample > self.max_value:
-                new_sample = self.max_value
-            elif new_sample < self.min_value:
-                new_sample = self.min_value
-                
-            amplified_data.append(new_sample)
+        samples = self.buffer.samples
         
-        return amplified_data
+        # Fixed-point gain with saturating clip, no float conversion of samples
+        gain, shift = fixed_point_gain(factor)
+        amplified = scale_samples(samples.reshape(-1), gain, shift,
+                                  self.min_value, self.max_value, samples.dtype)
+        
+        return self.buffer.with_samples(amplified.reshape(samples.shape))
     
-    def normalize(self):
+    def amplify(self, factor):
+        """
+        Amplify audio data by the given factor.
+        
+        Returns:
+            List of amplified audio samples
+        """
+        return self.amplify_buffer(factor).tolist()
+    
+    def normalize_buffer(self):
         """
         Normalize audio data to use the full dynamic range.
         
         Returns:
-            List of normalized audio samples
+            AudioBuffer of normalized audio samples
         """
         self.check_data()
         
+        samples = self.buffer.samples
+        
         # Find the maximum absolute value in the audio data
-        max_abs = max(abs(sample) for sample in self.audio_data)
+        max_abs = int(np.abs(samples.astype(np.int64)).max()) if samples.size else 0
         if max_abs == 0:  # Avoid division by zero
-            return self.audio_data.copy()
+            return self.buffer.with_samples(samples.copy())
         
         # Calculate normalization factor
         norm_factor = self.max_value / max_abs
         
         # Apply normalization
-        normalized_data = []
-        for sample in self.audio_data:
-            new_sample = int(sample * norm_factor)
-            normalized_data.append(new_sample)
+        gain, shift = fixed_point_gain(norm_factor)
+        normalized = scale_samples(samples.reshape(-1), gain, shift,
+                                   self.min_value, self.max_value, samples.dtype)
         
-        return normalized_data
+        return self.buffer.with_samples(normalized.reshape(samples.shape))
     
-    def anti_distortion(self, threshold=0.8):
+    def normalize(self):
+        """
+        Normalize audio data to use the full dynamic range.
+        
+        Returns:
+            List of normalized audio samples
+        """
+        return self.normalize_buffer().tolist()
+    
+    def anti_distortion_buffer(self, threshold=0.8):
         """
         Apply soft clipping to prevent harsh distortion using a tanh-like function.
         
@@ -88,41 +348,34 @@ class AudioProcessor:
             threshold: Threshold level (0.0-1.0) where soft clipping begins
             
         Returns:
-            List of processed audio samples with anti-distortion applied
+            AudioBuffer of processed audio samples with anti-distortion applied
         """
         self.check_data()
         
+        samples = self.buffer.samples
         print(f"Applying anti-distortion with threshold: {threshold}")
-        print("Before anti-distortion (first 10 samples):", self.audio_data[:10])
-        
-        threshold_value = int(self.max_value * threshold)
-        processed_data = []
-        
-        for sample in self.audio_data:
-            abs_sample = abs(sample)
-            if abs_sample > threshold_value:
-                # Apply soft clipping using a tanh-like function
-                sign = 1 if sample > 0 else -1
-                # Normalize to 0-1 range
-                normalized = abs_sample / self.max_value
-                # Apply soft curve above threshold
-                if normalized > threshold:
-                    normalized = threshold + (1 - threshold) * np.tanh((normalized - threshold) / (1 - threshold))
-                # Scale back to sample range
-                new_sample = int(sign * normalized * self.max_value)
-                
-                # Final clipping protection
-                if new_sample > self.max_value:
-                    new_sample = self.max_value
-                elif new_sample < self.min_value:
-                    new_sample = self.min_value
-                processed_data.append(new_sample)
-            else:
-                processed_data.append(sample)
-        
-        print("After anti-distortion (first 10 samples):", processed_data[:10])
-        
-        return processed_data
+        print("Before anti-distortion (first 10 samples):", samples.reshape(-1)[:10])
+        
+        bits_per_sample = self.buffer.bits_per_sample
+        if bits_per_sample in LOOKUP_TABLE_BIT_DEPTHS:
+            # Every possible input value maps to a fixed output: gather from the table
+            table = soft_clip_table(bits_per_sample, threshold)
+            processed = np.take(table, samples.astype(np.intp) - self.min_value)
+        else:
+            processed = soft_clip_curve(samples, threshold, self.min_value, self.max_value)
+        
+        print("After anti-distortion (first 10 samples):", processed.reshape(-1)[:10])
+        
+        return self.buffer.with_samples(processed)
+    
+    def anti_distortion(self, threshold=0.8):
+        """
+        Apply soft clipping to prevent harsh distortion using a tanh-like function.
+        
+        Returns:
+            List of processed audio samples with anti-distortion applied
+        """
+        return self.anti_distortion_buffer(threshold).tolist()
     
     def _stft(self, x, fft_size, hop_size):
         """
@@ -137,8 +390,8 @@ class AudioProcessor:
         Returns:
             Complex STFT matrix
         """
-        # Create Hanning window
-        window = np.hanning(fft_size)
+        # Get Hanning window
+        window = hanning_window(fft_size)
         
         # Calculate number of frames
         num_frames = 1 + (len(x) - fft_size) // hop_size
@@ -181,8 +434,8 @@ class AudioProcessor:
         Returns:
             Time domain signal
         """
-        # Create Hanning window
-        window = np.hanning(fft_size)
+        # Get Hanning window
+        window = hanning_window(fft_size)
         
         # Get number of frames
         num_frames = stft_matrix.shape[1]
@@ -246,54 +499,172 @@ class AudioProcessor:
         float_data = np.clip(float_data, -1.0, 1.0)
         
         # Scale and convert to integers
-        int_data = (float_data * self.max_value).astype(np.int32).tolist()
+        int_data = (float_data * self.max_value).astype(self.buffer.samples.dtype)
         
         return int_data
     
-    def remove_noise(self, noise_data, method='spectral_subtraction', alpha=2.0, beta=0.01, fft_size=2048, hop_size=512):
+    def estimate_noise_profile(self, noise_data, fft_size=2048, hop_size=512):
         """
-        Remove noise from audio using spectral subtraction.
+        Compute the average magnitude spectrum of a noise pattern.
         
         Args:
-            noise_data: Noise pattern audio samples
-            method: Noise removal method ('spectral_subtraction')
-            alpha: Oversubtraction factor (higher = more noise reduction)
-            beta: Spectral floor (higher = less musical noise)
+            noise_data: Noise pattern as an AudioBuffer or a sequence of samples
             fft_size: Size of FFT window
             hop_size: Number of samples between successive frames
             
         Returns:
-            List of processed audio samples with noise removed
+            Column vector of average noise magnitudes per frequency bin
+            (averaged over channels)
         """
         self.check_data()
         
+        if isinstance(noise_data, AudioBuffer):
+            noise_channels = noise_data.samples.T
+        else:
+            noise_channels = [noise_data]
+        
+        profiles = []
+        for channel in noise_channels:
+            noise_float = self._convert_to_float(channel)
+            noise_stft = self._stft(noise_float, fft_size, hop_size)
+            profiles.append(np.mean(np.abs(noise_stft), axis=1))
+        return np.mean(profiles, axis=0).reshape(-1, 1)
+    
+    def _remove_noise_online(self, x, alpha, beta, fft_size, hop_size, window_frames):
+        """
+        Spectral subtraction with the noise floor tracked from the input itself.
+        Frames are analysed, processed and overlap-added in a single pass, after
+        a look-ahead over the first window_frames frames so the opening of the
+        signal is not mistaken for noise. Input shorter than one frame is
+        zero-padded to a full frame.
+        
+        Args:
+            x: Input audio data as floats
+            alpha: Oversubtraction factor
+            beta: Spectral floor
+            fft_size: Size of FFT window
+            hop_size: Number of samples between successive frames
+            window_frames: Number of frames the noise minimum is tracked over
+            
+        Returns:
+            Time domain signal
+        """
+        window = hanning_window(fft_size)
+        estimator = MinimumStatisticsEstimator(window_frames)
+        
+        input_length = len(x)
+        if input_length < fft_size:
+            x = np.pad(x, (0, fft_size - input_length))
+        
+        num_frames = 1 + (len(x) - fft_size) // hop_size
+        expected_length = min((num_frames - 1) * hop_size + fft_size, len(x))
+        output = np.zeros(expected_length)
+        normalization = np.zeros(expected_length)
+        
+        # Look ahead so the minimum already spans a full window at the first frame
+        for i in range(min(window_frames, num_frames)):
+            start = i * hop_size
+            estimator.update(np.abs(np.fft.rfft(x[start:start+fft_size] * window)))
+        
+        for i in range(num_frames):
+            start = i * hop_size
+            spectrum = np.fft.rfft(x[start:start+fft_size] * window)
+            magnitude = np.abs(spectrum)
+            
+            # Subtract the current noise floor estimate
+            noise_mag = estimator.update(magnitude)
+            subtracted_mag = np.maximum(magnitude - alpha * noise_mag, beta * magnitude)
+            processed = subtracted_mag * np.exp(1j * np.angle(spectrum))
+            
+            # Overlap-add the processed frame
+            end = min(start + fft_size, expected_length)
+            frame = np.fft.irfft(processed, n=fft_size) * window
+            output[start:end] += frame[:end-start]
+            normalization[start:end] += window[:end-start]
+        
+        # Normalize to account for overlap
+        nonzero_indices = normalization > 1e-10
+        output[nonzero_indices] /= normalization[nonzero_indices]
+        
+        return output[:input_length]
+    
+    def _remove_noise_channel(self, channel, noise_profile, method, alpha, beta, fft_size, hop_size, window_frames):
+        """
+        Remove noise from a single channel.
+        
+        Returns:
+            Integer samples with noise removed
+        """
         # Convert to float
-        original_float = self._convert_to_float(self.audio_data)
-        noise_float = self._convert_to_float(noise_data)
+        original_float = self._convert_to_float(channel)
         
         if method == 'spectral_subtraction':
-            # Compute STFTs
+            # Compute STFT
             original_stft = self._stft(original_float, fft_size, hop_size)
-            noise_stft = self._stft(noise_float, fft_size, hop_size)
             
             # Get magnitude of spectra
             original_mag = np.abs(original_stft)
             
-            # Compute average noise spectrum
-            noise_mag = np.mean(np.abs(noise_stft), axis=1).reshape(-1, 1)
-            
             # Subtract noise spectrum
-            subtracted_mag = np.maximum(original_mag - alpha * noise_mag, beta * original_mag)
+            subtracted_mag = np.maximum(original_mag - alpha * noise_profile, beta * original_mag)
             
             # Reconstruct complex spectrum
             processed_stft = subtracted_mag * np.exp(1j * np.angle(original_stft))
             
             # Inverse STFT
             processed_float = self._istft(processed_stft, fft_size, hop_size, original_length=len(original_float))
-            
-            # Convert back to int
-            processed_data = self._convert_from_float(processed_float)
-            
-            return processed_data
+        elif method == 'minimum_statistics':
+            processed_float = self._remove_noise_online(
+                original_float, alpha, beta, fft_size, hop_size, window_frames)
         else:
-            raise ValueError(f"Unsupported noise removal method: {method}")
\ No newline at end of file
+            raise ValueError(f"Unsupported noise removal method: {method}")
+        
+        # Convert back to int
+        return self._convert_from_float(processed_float)
+    
+    def remove_noise_buffer(self, noise_data=None, method='spectral_subtraction', alpha=2.0, beta=0.01, fft_size=2048, hop_size=512, noise_profile=None, window_frames=96):
+        """
+        Remove noise from audio using spectral subtraction. Each channel is
+        processed separately.
+        
+        Args:
+            noise_data: Noise pattern as an AudioBuffer or a sequence of samples
+                (not used by 'minimum_statistics')
+            method: Noise removal method ('spectral_subtraction' with a noise pattern,
+                or 'minimum_statistics' to estimate the noise from the input itself)
+            alpha: Oversubtraction factor (higher = more noise reduction)
+            beta: Spectral floor (higher = less musical noise)
+            fft_size: Size of FFT window
+            hop_size: Number of samples between successive frames
+            noise_profile: Precomputed result of estimate_noise_profile() (optional)
+            window_frames: Number of frames the 'minimum_statistics' noise floor is
+                tracked over
+            
+        Returns:
+            AudioBuffer of processed audio samples with noise removed
+        """
+        self.check_data()
+        
+        if method == 'spectral_subtraction' and noise_profile is None:
+            # Compute average noise spectrum
+            if noise_data is None:
+                raise ValueError("Spectral subtraction requires a noise pattern")
+            noise_profile = self.estimate_noise_profile(noise_data, fft_size, hop_size)
+        
+        processed_channels = [
+            self._remove_noise_channel(channel, noise_profile, method, alpha, beta,
+                                       fft_size, hop_size, window_frames)
+            for channel in self.buffer.samples.T
+        ]
+        
+        return self.buffer.with_samples(np.stack(processed_channels, axis=1))
+    
+    def remove_noise(self, noise_data=None, method='spectral_subtraction', alpha=2.0, beta=0.01, fft_size=2048, hop_size=512, noise_profile=None, window_frames=96):
+        """
+        Remove noise from audio using spectral subtraction.
+        
+        Returns:
+            List of processed audio samples with noise removed
+        """
+        return self.remove_noise_buffer(noise_data, method, alpha, beta, fft_size, hop_size,
+                                        noise_profile, window_frames).tolist()
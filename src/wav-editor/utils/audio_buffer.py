@@ -0,0 +1,114 @@
+# utils/audio_buffer.py
+import numpy as np
+from .wav_utils import get_sample_dtype
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+class AudioBuffer:
+    """
+    Audio samples together with their format.
+
+    Samples are stored as a NumPy array of shape (frames, channels) using the
+    smallest signed integer type for the bit depth (see get_sample_dtype).
+    """
+
+    __slots__ = ('samples', 'sample_rate', 'bits_per_sample', 'audio_format')
+
+    def __init__(self, samples, sample_rate, bits_per_sample, audio_format=WAVE_FORMAT_PCM):
+        """
+        Args:
+            samples: Array of samples, (frames, channels) or 1-D for mono
+            sample_rate: Sample rate in Hz
+            bits_per_sample: Bit depth (8, 16, 24 or 32)
+            audio_format: WAV format tag from the fmt chunk
+        """
+        samples = np.asarray(samples, dtype=get_sample_dtype(bits_per_sample))
+        if samples.ndim == 1:
+            samples = samples.reshape(-1, 1)
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.bits_per_sample = bits_per_sample
+        self.audio_format = audio_format
+
+    @classmethod
+    def from_interleaved(cls, audio_data, num_channels, sample_rate, bits_per_sample,
+                         audio_format=WAVE_FORMAT_PCM):
+        """
+        Build a buffer from interleaved samples, as stored in a WAV data chunk.
+        Samples left over after the last complete frame are dropped.
+        """
+        samples = np.asarray(audio_data, dtype=get_sample_dtype(bits_per_sample))
+        num_channels = max(num_channels, 1)
+        num_frames = len(samples) // num_channels
+        samples = samples[:num_frames * num_channels].reshape(num_frames, num_channels)
+        return cls(samples, sample_rate, bits_per_sample, audio_format)
+
+    @classmethod
+    def from_header(cls, header, audio_data):
+        """
+        Build a buffer from a header dictionary and a list of interleaved samples.
+        """
+        return cls.from_interleaved(audio_data, header.get('num_channels', 1),
+                                    header.get('sample_rate', 0), header['bits_per_sample'],
+                                    header.get('audio_format', WAVE_FORMAT_PCM))
+
+    def with_samples(self, samples):
+        """Return a new buffer with the same format and different samples."""
+        return AudioBuffer(samples, self.sample_rate, self.bits_per_sample, self.audio_format)
+
+    @property
+    def num_frames(self):
+        return self.samples.shape[0]
+
+    @property
+    def num_channels(self):
+        return self.samples.shape[1]
+
+    @property
+    def duration(self):
+        """Duration in seconds."""
+        return self.num_frames / self.sample_rate if self.sample_rate else 0.0
+
+    def interleaved(self):
+        """Return the samples as a 1-D array in WAV (interleaved) order."""
+        return np.ascontiguousarray(self.samples).reshape(-1)
+
+    def to_header(self):
+        """
+        Build the header dictionary for writing these samples as a canonical
+        PCM WAV file (fmt chunk directly followed by the data chunk).
+        """
+        block_align = self.num_channels * (self.bits_per_sample // 8)
+        data_size = self.num_frames * block_align
+        audio_format = self.audio_format
+        if audio_format == WAVE_FORMAT_EXTENSIBLE:
+            # The extension is not kept, so the file is written as plain PCM
+            audio_format = WAVE_FORMAT_PCM
+
+        return {
+            'chunk_id': b'RIFF',
+            'chunk_size': 36 + data_size,
+            'format': b'WAVE',
+            'fmt_chunk_id': b'fmt ',
+            'fmt_chunk_size': 16,
+            'audio_format': audio_format,
+            'num_channels': self.num_channels,
+            'sample_rate': self.sample_rate,
+            'byte_rate': self.sample_rate * block_align,
+            'block_align': block_align,
+            'bits_per_sample': self.bits_per_sample,
+            'data_chunk_id': b'data',
+            'data_size': data_size
+        }
+
+    def tolist(self):
+        """Return the samples as a list of interleaved ints (legacy format)."""
+        return self.interleaved().tolist()
+
+    def __len__(self):
+        return self.num_frames
+
+    def __repr__(self):
+        return (f"AudioBuffer(frames={self.num_frames}, channels={self.num_channels}, "
+                f"sample_rate={self.sample_rate}, bits_per_sample={self.bits_per_sample})")
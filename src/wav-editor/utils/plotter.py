@@ -1,25 +1,29 @@
 # utils/plotter.py
-import matplotlib.pyplot as plt
+import numpy as np
 
 def plot_audio(original_data, processed_data, sample_rate, output_path="audio_plot.png"):
     """
     Plot original and processed audio waveforms side by side.
 
     Args:
-        original_data: List of original audio samples
-        processed_data: List of processed audio samples
+        original_data: Array of original audio samples (frames x channels, or 1-D)
+        processed_data: Array of processed audio samples (frames x channels, or 1-D)
         sample_rate: Sample rate of the audio (in Hz)
         output_path: Path to save the plot (default: "audio_plot.png")
     """
-    # Calculate time axis
-    time = [i / sample_rate for i in range(len(original_data))]
+    # matplotlib is only needed here, so don't make every import of this module pay for it
+    import matplotlib.pyplot as plt
+
+    # Calculate time axes (noise removal can shorten the processed audio)
+    original_time = np.arange(len(original_data)) / sample_rate
+    processed_time = np.arange(len(processed_data)) / sample_rate
 
     # Create a figure with two subplots side by side
     plt.figure(figsize=(12, 6))
 
     # Plot original audio
     plt.subplot(1, 2, 1)
-    plt.plot(time, original_data, label="Original", color="blue")
+    plt.plot(original_time, original_data, label="Original", color="blue")
     plt.title("Original Audio")
     plt.xlabel("Time (s)")
     plt.ylabel("Amplitude")
@@ -28,7 +32,7 @@ def plot_audio(original_data, processed_data, sample_rate, output_path="audio_pl
 
     # Plot processed audio
     plt.subplot(1, 2, 2)
-    plt.plot(time, processed_data, label="Processed", color="orange")
+    plt.plot(processed_time, processed_data, label="Processed", color="orange")
     plt.title("Processed Audio")
     plt.xlabel("Time (s)")
     plt.ylabel("Amplitude")
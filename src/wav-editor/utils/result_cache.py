@@ -0,0 +1,155 @@
+# utils/result_cache.py
+import hashlib
+import json
+import os
+import shutil
+from .wav_reader import read_wav_header, read_fmt_chunk, find_data_chunk
+
+CACHE_FORMAT_VERSION = 2
+HASH_BLOCK_SIZE = 1 << 20
+
+def hash_data_chunk(file_path):
+    """
+    Hash the format fields and data chunk of a WAV file.
+
+    Args:
+        file_path: Path to the WAV file
+
+    Returns:
+        Hex digest of the audio content (metadata chunks are ignored)
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        read_wav_header(file)
+        fmt_data = read_fmt_chunk(file)
+        # Only the fields that affect decoding, not the chunk ids/sizes
+        digest.update(repr(fmt_data[2:]).encode('ascii'))
+
+        _, data_size = find_data_chunk(file)
+        remaining = data_size
+        while remaining > 0:
+            block = file.read(min(HASH_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+
+    return digest.hexdigest()
+
+class ResultCache:
+    """
+    Content-addressed cache of processed WAV files with LRU eviction.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        """
+        Args:
+            cache_dir: Directory holding the cached output files
+            max_size: Maximum total size of the cache in bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self, input_path, effect_chain, noise_pattern=None):
+        """
+        Build the cache key for a processing job.
+
+        Args:
+            input_path: Path to the input WAV file
+            effect_chain: List of (effect_name, parameters) in application order
+            noise_pattern: Path to the noise pattern WAV file, if any
+
+        Returns:
+            Hex digest identifying the job
+        """
+        key_data = {
+            'version': CACHE_FORMAT_VERSION,
+            'input': hash_data_chunk(input_path),
+            'effects': effect_chain,
+            'noise': hash_data_chunk(noise_pattern) if noise_pattern else None,
+        }
+        encoded = json.dumps(key_data, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.wav")
+
+    def _metadata_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def fetch(self, key, output_path):
+        """
+        Copy a cached result to output_path if present.
+
+        Returns:
+            Metadata dictionary stored with the entry on a cache hit, None otherwise
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(self._metadata_path(key), 'r', encoding='utf-8') as file:
+                metadata = json.load(file)
+            shutil.copyfile(entry_path, output_path)
+            # Mark as recently used for LRU eviction
+            os.utime(entry_path)
+        except FileNotFoundError:
+            # Missing, or evicted by another process while we were reading it
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return metadata
+
+    def store(self, key, output_path, metadata=None):
+        """
+        Add a freshly written output file to the cache and evict old entries.
+
+        Args:
+            key: Cache key from make_key()
+            output_path: Path of the output file to cache
+            metadata: JSON-serializable dictionary returned by fetch() on a hit
+        """
+        suffix = f".{os.getpid()}.tmp"
+        metadata_path = self._metadata_path(key)
+        with open(metadata_path + suffix, 'w', encoding='utf-8') as file:
+            json.dump(metadata or {}, file)
+        os.replace(metadata_path + suffix, metadata_path)
+
+        entry_path = self._entry_path(key)
+        shutil.copyfile(output_path, entry_path + suffix)
+        os.replace(entry_path + suffix, entry_path)
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits in max_size.
+        """
+        entries = []
+        total_size = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.wav'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            for entry_file in (path, path[:-len('.wav')] + '.json'):
+                try:
+                    os.remove(entry_file)
+                except FileNotFoundError:
+                    pass
+            total_size -= size
+
+    def summary(self):
+        """Return a one-line description of the hit/miss counters."""
+        return f"Result cache: {self.hits} hits, {self.misses} misses"
@@ -0,0 +1,164 @@
+# utils/wav_index.py
+import argparse
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from .wav_reader import probe_wav_file
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS wav_files (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    audio_format INTEGER,
+    num_channels INTEGER,
+    sample_rate INTEGER,
+    bits_per_sample INTEGER,
+    num_frames INTEGER,
+    duration REAL,
+    error TEXT
+)
+"""
+
+COLUMNS = ('path', 'mtime', 'size', 'audio_format', 'num_channels', 'sample_rate',
+           'bits_per_sample', 'num_frames', 'duration', 'error')
+
+def open_index(db_path):
+    """Open (and create if needed) the SQLite metadata index."""
+    connection = sqlite3.connect(db_path)
+    connection.execute(SCHEMA)
+    return connection
+
+def scan_directory(root):
+    """
+    Walk a directory tree and yield (path, mtime, size) for every WAV file.
+    """
+    for dir_path, _, file_names in os.walk(root):
+        for file_name in file_names:
+            if not file_name.lower().endswith('.wav'):
+                continue
+            path = os.path.abspath(os.path.join(dir_path, file_name))
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            yield path, stat.st_mtime, stat.st_size
+
+def probe_entry(entry):
+    """
+    Probe one file's header and build its index row.
+
+    Args:
+        entry: Tuple of (path, mtime, size)
+
+    Returns:
+        Tuple of values in COLUMNS order
+    """
+    path, mtime, size = entry
+    try:
+        header = probe_wav_file(path)
+    except Exception as e:
+        return (path, mtime, size, None, None, None, None, None, None, str(e))
+
+    return (path, mtime, size, header['audio_format'], header['num_channels'],
+            header['sample_rate'], header['bits_per_sample'], header['num_frames'],
+            header['duration'], None)
+
+def update_index(db_path, root, workers=8):
+    """
+    Incrementally index all WAV files below root.
+    Files whose mtime and size are unchanged since the last run are not re-read,
+    and entries for files that no longer exist under root are removed.
+
+    Args:
+        db_path: Path to the SQLite index file
+        root: Directory to scan
+        workers: Number of threads probing headers in parallel
+
+    Returns:
+        Dictionary with 'probed', 'unchanged' and 'removed' counts
+    """
+    root = os.path.abspath(root)
+    connection = open_index(db_path)
+    try:
+        prefix = os.path.join(root, '')
+        known = {
+            path: (mtime, size)
+            for path, mtime, size in connection.execute(
+                "SELECT path, mtime, size FROM wav_files WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix))
+        }
+
+        seen = set()
+        stale = []
+        for path, mtime, size in scan_directory(root):
+            seen.add(path)
+            if known.get(path) != (mtime, size):
+                stale.append((path, mtime, size))
+
+        removed = [path for path in known if path not in seen]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(probe_entry, stale))
+
+        with connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO wav_files ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(COLUMNS))})",
+                rows)
+            connection.executemany("DELETE FROM wav_files WHERE path = ?",
+                                   [(path,) for path in removed])
+    finally:
+        connection.close()
+
+    return {
+        'probed': len(rows),
+        'unchanged': len(seen) - len(rows),
+        'removed': len(removed),
+    }
+
+def query_index(db_path, min_duration=None, max_duration=None, sample_rate=None,
+                bits_per_sample=None, num_channels=None):
+    """
+    Query the index for successfully probed files matching the given filters.
+
+    Returns:
+        List of dictionaries keyed by column name
+    """
+    conditions = ["error IS NULL"]
+    params = []
+    if min_duration is not None:
+        conditions.append("duration >= ?")
+        params.append(min_duration)
+    if max_duration is not None:
+        conditions.append("duration <= ?")
+        params.append(max_duration)
+    for column, value in (('sample_rate', sample_rate),
+                          ('bits_per_sample', bits_per_sample),
+                          ('num_channels', num_channels)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+
+    connection = open_index(db_path)
+    try:
+        cursor = connection.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM wav_files "
+            f"WHERE {' AND '.join(conditions)} ORDER BY path",
+            params)
+        return [dict(zip(COLUMNS, row)) for row in cursor]
+    finally:
+        connection.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or update a WAV metadata index")
+    parser.add_argument("root", help="Directory to scan for WAV files")
+    parser.add_argument("--db", default="wav_index.sqlite", help="SQLite index file")
+    parser.add_argument("--workers", type=int, default=8, help="Number of parallel header probes")
+
+    args = parser.parse_args()
+
+    counts = update_index(args.db, args.root, args.workers)
+    print(f"Probed: {counts['probed']} files")
+    print(f"Unchanged: {counts['unchanged']} files")
+    print(f"Removed: {counts['removed']} files")
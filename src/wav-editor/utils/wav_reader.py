@@ -1,6 +1,7 @@
 # wav_reader.py
 import struct
 import numpy as np
+from .audio_buffer import AudioBuffer
 
 def read_wav_header(file):
     """Read and validate the WAV file header."""
@@ -33,7 +34,7 @@ def read_fmt_chunk(file):
     
     # Skip any extra fmt bytes
     if fmt_chunk_size > 16:
-        file.read(fmt_chunk_size - 16)
+        file.seek(fmt_chunk_size - 16, 1)
     
     return (fmt_chunk_id, fmt_chunk_size, audio_format, num_channels, 
             sample_rate, byte_rate, block_align, bits_per_sample)
@@ -44,7 +45,7 @@ def find_data_chunk(file):
     while data_chunk_id != b'data':
         # Skip this chunk
         chunk_size = struct.unpack('<I', file.read(4))[0]
-        file.read(chunk_size)
+        file.seek(chunk_size, 1)
         data_chunk_id = file.read(4)
         
         if len(data_chunk_id) < 4:  # EOF
@@ -53,26 +54,22 @@ def find_data_chunk(file):
     data_size = struct.unpack('<I', file.read(4))[0]
     return data_chunk_id, data_size
 
-def read_8bit_audio_data(raw_data):
-    """Process 8-bit audio data."""
-    fmt = 'B'  # unsigned char
-    samples_count = len(raw_data)
+def decode_8bit_audio_data(raw_data):
+    """Decode 8-bit audio data (unsigned in the file) to signed int8 samples."""
     # Convert to signed for consistent processing
-    return [sample - 128 for sample in struct.unpack(f'{samples_count}{fmt}', raw_data)]
+    return (np.frombuffer(raw_data, dtype=np.uint8) ^ 0x80).view(np.int8)
 
-def read_24bit_audio_data(raw_data, bytes_per_sample):
-    """Process 24-bit audio data."""
+def decode_24bit_audio_data(raw_data, bytes_per_sample):
+    """Decode 24-bit audio data to int32 samples."""
     samples_count = len(raw_data) // bytes_per_sample
-    audio_data = []
-    for i in range(samples_count):
-        start = i * bytes_per_sample
-        # Convert 3 bytes (24-bit) to a signed int
-        value = int.from_bytes(raw_data[start:start+3], byteorder='little', signed=True)
-        audio_data.append(value)
-    return audio_data
+    triplets = np.frombuffer(raw_data, dtype=np.uint8, count=samples_count * 3).reshape(-1, 3)
+    # Place the 3 bytes in the top of an int32, then shift back to sign extend
+    padded = np.zeros((samples_count, 4), dtype=np.uint8)
+    padded[:, 1:] = triplets
+    return padded.view('<i4').reshape(-1) >> 8
 
-def read_standard_audio_data(raw_data, bits_per_sample, bytes_per_sample):
-    """Process 16-bit or 32-bit audio data with NumPy."""
+def decode_standard_audio_data(raw_data, bits_per_sample, bytes_per_sample):
+    """Decode 16-bit or 32-bit audio data."""
     if bits_per_sample == 16:
         dtype = np.int16
     elif bits_per_sample == 32:
@@ -80,52 +77,106 @@ def read_standard_audio_data(raw_data, bits_per_sample, bytes_per_sample):
     else:
         raise ValueError(f"Unexpected bit depth: {bits_per_sample}")
 
-    if len(raw_data) % bytes_per_sample != 0:
-        print(f"Warning: Truncating {len(raw_data) % bytes_per_sample} leftover bytes")
-    return np.frombuffer(raw_data, dtype=dtype).tolist()
+    leftover = len(raw_data) % bytes_per_sample
+    if leftover != 0:
+        print(f"Warning: Truncating {leftover} leftover bytes")
+    return np.frombuffer(raw_data, dtype=dtype, count=len(raw_data) // bytes_per_sample)
 
-def read_wav_file(file_path):
+def decode_audio_data(raw_data, bits_per_sample):
+    """
+    Decode a raw data chunk to a 1-D array of interleaved samples.
+    """
+    bytes_per_sample = bits_per_sample // 8
+    if bits_per_sample == 8:
+        return decode_8bit_audio_data(raw_data)
+    elif bits_per_sample == 24:
+        return decode_24bit_audio_data(raw_data, bytes_per_sample)
+    else:
+        return decode_standard_audio_data(raw_data, bits_per_sample, bytes_per_sample)
+
+def read_8bit_audio_data(raw_data):
+    """Process 8-bit audio data into a list (compatibility wrapper)."""
+    return decode_8bit_audio_data(raw_data).tolist()
+
+def read_24bit_audio_data(raw_data, bytes_per_sample):
+    """Process 24-bit audio data into a list (compatibility wrapper)."""
+    return decode_24bit_audio_data(raw_data, bytes_per_sample).tolist()
+
+def read_standard_audio_data(raw_data, bits_per_sample, bytes_per_sample):
+    """Process 16-bit or 32-bit audio data into a list (compatibility wrapper)."""
+    return decode_standard_audio_data(raw_data, bits_per_sample, bytes_per_sample).tolist()
+
+def read_header_info(file):
+    """
+    Read all header chunks up to the start of the audio data.
+    Leaves the file positioned at the first byte of the data chunk.
+    """
+    riff_chunk_id, chunk_size, format_id = read_wav_header(file)
+    
+    fmt_data = read_fmt_chunk(file)
+    (fmt_chunk_id, fmt_chunk_size, audio_format, num_channels, 
+     sample_rate, byte_rate, block_align, bits_per_sample) = fmt_data
+    
+    data_chunk_id, data_size = find_data_chunk(file)
+    
+    return {
+        'chunk_id': riff_chunk_id,
+        'chunk_size': chunk_size,
+        'format': format_id,
+        'fmt_chunk_id': fmt_chunk_id,
+        'fmt_chunk_size': fmt_chunk_size,
+        'audio_format': audio_format,
+        'num_channels': num_channels,
+        'sample_rate': sample_rate,
+        'byte_rate': byte_rate,
+        'block_align': block_align,
+        'bits_per_sample': bits_per_sample,
+        'data_chunk_id': data_chunk_id,
+        'data_size': data_size
+    }
+
+def probe_wav_file(file_path):
+    """
+    Read only the header of a WAV file, without decoding the audio data.
+    Returns the header dictionary extended with 'num_frames' and 'duration'.
+    """
+    with open(file_path, 'rb') as file:
+        header = read_header_info(file)
+    
+    block_align = header['block_align'] or 1
+    num_frames = header['data_size'] // block_align
+    header['num_frames'] = num_frames
+    header['duration'] = num_frames / header['sample_rate'] if header['sample_rate'] else 0.0
+    return header
+
+def read_audio_buffer(file_path):
     """
     Manually read a WAV file without using audio libraries.
-    Returns a tuple of (header_info, audio_data)
+    Returns an AudioBuffer
     """
     with open(file_path, 'rb') as file:
         # Read header sections
-        riff_chunk_id, chunk_size, format_id = read_wav_header(file)
-        
-        fmt_data = read_fmt_chunk(file)
-        (fmt_chunk_id, fmt_chunk_size, audio_format, num_channels, 
-         sample_rate, byte_rate, block_align, bits_per_sample) = fmt_data
-        
-        data_chunk_id, data_size = find_data_chunk(file)
+        header = read_header_info(file)
         
-        # Construct header information
-        header = {
-            'chunk_id': riff_chunk_id,
-            'chunk_size': chunk_size,
-            'format': format_id,
-            'fmt_chunk_id': fmt_chunk_id,
-            'fmt_chunk_size': fmt_chunk_size,
-            'audio_format': audio_format,
-            'num_channels': num_channels,
-            'sample_rate': sample_rate,
-            'byte_rate': byte_rate,
-            'block_align': block_align,
-            'bits_per_sample': bits_per_sample,
-            'data_chunk_id': data_chunk_id,
-            'data_size': data_size
-        }
+        # Read and decode the actual audio data
+        raw_data = file.read(header['data_size'])
+        audio_data = decode_audio_data(raw_data, header['bits_per_sample'])
+    
+    return AudioBuffer.from_interleaved(audio_data, header['num_channels'], header['sample_rate'],
+                                        header['bits_per_sample'], header['audio_format'])
+
+def read_wav_file(file_path):
+    """
+    Manually read a WAV file without using audio libraries.
+    Returns a tuple of (header_info, audio_data) with audio_data as a list of
+    interleaved samples (compatibility wrapper, see read_audio_buffer)
+    """
+    with open(file_path, 'rb') as file:
+        # Read header sections
+        header = read_header_info(file)
         
         # Read the actual audio data
-        raw_data = file.read(data_size)
-        bytes_per_sample = bits_per_sample // 8
-        
-        # Process audio data based on bit depth
-        if bits_per_sample == 8:
-            audio_data = read_8bit_audio_data(raw_data)
-        elif bits_per_sample == 24:
-            audio_data = read_24bit_audio_data(raw_data, bytes_per_sample)
-        else:
-            audio_data = read_standard_audio_data(raw_data, bits_per_sample, bytes_per_sample)
+        raw_data = file.read(header['data_size'])
+        audio_data = decode_audio_data(raw_data, header['bits_per_sample'])
         
-        return header, audio_data
\ No newline at end of file
+        return header, audio_data.tolist()
@@ -1,3 +1,5 @@
+import numpy as np
+
 def get_bit_depth_range(bits_per_sample):
     """
     Calculate the maximum and minimum values based on bit depth.
@@ -21,3 +23,18 @@ def get_bit_depth_range(bits_per_sample):
     
     min_value = -max_value - 1
     return min_value, max_value
+
+def get_sample_dtype(bits_per_sample):
+    """
+    Get the smallest NumPy integer type holding signed samples of a bit depth.
+    
+    Args:
+        bits_per_sample: Integer representing the number of bits per sample
+        
+    Returns:
+        NumPy dtype (8-bit samples are signed after reading)
+    """
+    dtypes = {8: np.int8, 16: np.int16, 24: np.int32, 32: np.int32}
+    if bits_per_sample not in dtypes:
+        raise ValueError(f"Unsupported bit depth: {bits_per_sample}")
+    return dtypes[bits_per_sample]
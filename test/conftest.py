@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The package directory ("wav-editor") is not a valid identifier, so tests load
+# modules with importlib.import_module("wav-editor....") from the src directory.
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -0,0 +1,65 @@
+import importlib
+
+import numpy as np
+import pytest
+
+wav_processors = importlib.import_module('wav-editor.core.wav_processors')
+wav_utils = importlib.import_module('wav-editor.utils.wav_utils')
+
+THRESHOLDS = (0.0, 0.5, 0.8, 0.95, 1.0, 2.0)
+
+
+def make_processor(samples, bits):
+    header = {'bits_per_sample': bits, 'num_channels': 1, 'sample_rate': 8000}
+    return wav_processors.AudioProcessor().load_data(header, samples)
+
+
+def reference(samples, threshold, bits):
+    """Per-sample soft clipping, as in the original loop."""
+    min_value, max_value = wav_utils.get_bit_depth_range(bits)
+    threshold_value = int(max_value * threshold)
+    processed = []
+    for sample in samples:
+        abs_sample = abs(sample)
+        if abs_sample > threshold_value:
+            sign = 1 if sample > 0 else -1
+            normalized = abs_sample / max_value
+            if normalized > threshold:
+                normalized = threshold + (1 - threshold) * np.tanh((normalized - threshold) / (1 - threshold))
+            processed.append(max(min(int(sign * normalized * max_value), max_value), min_value))
+        else:
+            processed.append(sample)
+    return processed
+
+
+@pytest.mark.parametrize('bits', wav_processors.LOOKUP_TABLE_BIT_DEPTHS)
+@pytest.mark.parametrize('threshold', THRESHOLDS)
+def test_table_matches_curve(bits, threshold):
+    min_value, max_value = wav_utils.get_bit_depth_range(bits)
+    samples = np.arange(min_value, max_value + 1)
+    processor = make_processor(samples, bits)
+
+    processed = processor.anti_distortion_buffer(threshold).samples[:, 0]
+
+    expected = wav_processors.soft_clip_curve(samples, threshold, min_value, max_value)
+    np.testing.assert_array_equal(processed, expected)
+
+
+@pytest.mark.parametrize('bits', wav_processors.LOOKUP_TABLE_BIT_DEPTHS)
+@pytest.mark.parametrize('threshold', [t for t in THRESHOLDS if t != 1.0])
+def test_table_matches_per_sample_loop(bits, threshold):
+    min_value, max_value = wav_utils.get_bit_depth_range(bits)
+    samples = list(range(min_value, max_value + 1))
+    processor = make_processor(samples, bits)
+
+    assert processor.anti_distortion(threshold) == reference(samples, threshold, bits)
+
+
+@pytest.mark.parametrize('bits', wav_processors.LOOKUP_TABLE_BIT_DEPTHS)
+def test_min_value_at_full_threshold(bits):
+    # |min_value| is the only magnitude above max_value, so it is the only sample
+    # past a threshold of 1.0; it is soft clipped to -max_value
+    min_value, max_value = wav_utils.get_bit_depth_range(bits)
+    processor = make_processor([min_value, -max_value, 0, max_value], bits)
+
+    assert processor.anti_distortion(1.0) == [-max_value, -max_value, 0, max_value]
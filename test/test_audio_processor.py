@@ -0,0 +1,32 @@
+import importlib
+
+import numpy as np
+
+wav_processors = importlib.import_module('wav-editor.core.wav_processors')
+audio_buffer = importlib.import_module('wav-editor.utils.audio_buffer')
+
+
+def test_load_data_keeps_list_api():
+    header = {'audio_format': 1, 'num_channels': 2, 'sample_rate': 8000,
+              'bits_per_sample': 16, 'data_size': 8, 'fmt_chunk_size': 18}
+    audio_data = [1, -2, 3, -4]
+
+    processor = wav_processors.AudioProcessor().load_data(header, audio_data)
+
+    assert processor.header is header
+    assert processor.audio_data == audio_data
+    assert processor.buffer.samples.shape == (2, 2)
+
+
+def test_load_buffer_builds_canonical_header():
+    processor = wav_processors.AudioProcessor()
+    assert processor.header is None
+    assert processor.audio_data is None
+
+    samples = np.array([[1, -1], [2, -2], [3, -3]], dtype=np.int16)
+    processor.load_buffer(audio_buffer.AudioBuffer(samples, 8000, 16))
+
+    assert processor.header['num_channels'] == 2
+    assert processor.header['data_size'] == 12
+    assert processor.header['fmt_chunk_size'] == 16
+    assert processor.audio_data == [1, -1, 2, -2, 3, -3]
@@ -0,0 +1,55 @@
+import importlib
+
+import numpy as np
+import pytest
+
+wav_processors = importlib.import_module('wav-editor.core.wav_processors')
+wav_utils = importlib.import_module('wav-editor.utils.wav_utils')
+
+BIT_DEPTHS = (8, 16, 24, 32)
+FACTORS = (0.7, -0.7, 1.1, -1.1, 0.3, 1 / 3, 2.5, 1e-9, 1e30, -1e30, 2 ** 31 - 1, 0.0, 1.0)
+
+
+def make_processor(samples, bits):
+    header = {'bits_per_sample': bits, 'num_channels': 1, 'sample_rate': 8000}
+    return wav_processors.AudioProcessor().load_data(header, samples)
+
+
+def make_samples(bits):
+    min_value, max_value = wav_utils.get_bit_depth_range(bits)
+    if bits <= 16:
+        return list(range(min_value, max_value + 1))
+
+    # Multiples of 10 hit products just below an integer (e.g. 10 * 0.7 = 6.999...)
+    samples = list(range(-100000, 100001, 10))
+    samples += [min_value, min_value + 1, max_value - 1, max_value, -1, 0, 1]
+    rng = np.random.default_rng(bits)
+    samples += rng.integers(min_value, max_value, 10000, endpoint=True).tolist()
+    return samples
+
+
+def reference(samples, factor, bits):
+    """Per-sample float gain with truncation and clipping, as in the original loop."""
+    min_value, max_value = wav_utils.get_bit_depth_range(bits)
+    return [max(min(int(sample * factor), max_value), min_value) for sample in samples]
+
+
+@pytest.mark.parametrize('bits', BIT_DEPTHS)
+@pytest.mark.parametrize('factor', FACTORS)
+def test_amplify_matches_float_gain(bits, factor):
+    samples = make_samples(bits)
+    processor = make_processor(samples, bits)
+
+    assert processor.amplify(factor) == reference(samples, factor, bits)
+
+
+@pytest.mark.parametrize('bits', BIT_DEPTHS)
+@pytest.mark.parametrize('peak', (3, 7, 10, 1000, 'min', 'max'))
+def test_normalize_matches_float_gain(bits, peak):
+    min_value, max_value = wav_utils.get_bit_depth_range(bits)
+    peak = {'min': min_value, 'max': max_value}.get(peak, peak)
+    samples = [sample for sample in make_samples(bits) if abs(sample) <= abs(peak)]
+    processor = make_processor(samples, bits)
+
+    norm_factor = max_value / max(abs(sample) for sample in samples)
+    assert processor.normalize() == reference(samples, norm_factor, bits)
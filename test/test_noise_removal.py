@@ -0,0 +1,48 @@
+import importlib
+
+import numpy as np
+
+wav_processors = importlib.import_module('wav-editor.core.wav_processors')
+audio_buffer = importlib.import_module('wav-editor.utils.audio_buffer')
+
+SAMPLE_RATE = 44100
+BURST_STARTS = (0.0, 1.5, 3.0, 4.5)
+BURST_LENGTH = 0.3
+
+
+def make_processor(samples):
+    buffer = audio_buffer.AudioBuffer(samples, SAMPLE_RATE, 16)
+    return wav_processors.AudioProcessor().load_buffer(buffer)
+
+
+def burst_rms(samples, start):
+    begin = int(start * SAMPLE_RATE)
+    end = begin + int(BURST_LENGTH * SAMPLE_RATE)
+    burst = samples[begin:end].astype(np.float64)
+    return np.sqrt(np.mean(burst ** 2))
+
+
+def test_minimum_statistics_keeps_opening_burst():
+    rng = np.random.default_rng(0)
+    t = np.arange(int(6 * SAMPLE_RATE)) / SAMPLE_RATE
+    signal = rng.normal(0, 300, len(t))
+    for start in BURST_STARTS:
+        in_burst = (t >= start) & (t < start + BURST_LENGTH)
+        signal[in_burst] += 10000 * np.sin(2 * np.pi * 1000 * t[in_burst])
+
+    processor = make_processor(np.round(signal).astype(np.int16))
+    processed = processor.remove_noise_buffer(method='minimum_statistics').samples[:, 0]
+
+    levels = [burst_rms(processed, start) for start in BURST_STARTS]
+    # The first burst must not be treated as noise just because it comes first
+    assert levels[0] > 0.8 * np.mean(levels[1:])
+
+
+def test_minimum_statistics_short_input():
+    samples = np.linspace(-1000, 1000, 300).astype(np.int16)
+    processor = make_processor(samples)
+
+    processed = processor.remove_noise_buffer(method='minimum_statistics', fft_size=2048)
+
+    assert processed.num_frames == len(samples)
+    assert np.any(processed.samples != 0)
@@ -0,0 +1,48 @@
+import importlib
+import os
+
+import numpy as np
+
+result_cache = importlib.import_module('wav-editor.utils.result_cache')
+audio_buffer = importlib.import_module('wav-editor.utils.audio_buffer')
+wav_writer = importlib.import_module('wav-editor.utils.wav_writer')
+
+
+def write_test_file(path):
+    samples = np.arange(-500, 500, dtype=np.int16)
+    wav_writer.write_audio_buffer(path, audio_buffer.AudioBuffer(samples, 8000, 16))
+
+
+def test_fetch_hit_returns_metadata(tmp_path):
+    output_path = str(tmp_path / 'output.wav')
+    write_test_file(output_path)
+    cache = result_cache.ResultCache(str(tmp_path / 'cache'), 1 << 20)
+
+    key = cache.make_key(output_path, [('amplify', {'factor': 2.0})])
+    cache.store(key, output_path, {'processed_max': 998})
+
+    copy_path = str(tmp_path / 'copy.wav')
+    assert cache.fetch(key, copy_path) == {'processed_max': 998}
+    with open(output_path, 'rb') as original, open(copy_path, 'rb') as copy:
+        assert original.read() == copy.read()
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_entry_evicted_during_fetch_is_a_miss(tmp_path, monkeypatch):
+    output_path = str(tmp_path / 'output.wav')
+    write_test_file(output_path)
+    cache = result_cache.ResultCache(str(tmp_path / 'cache'), 1 << 20)
+    key = cache.make_key(output_path, [])
+    cache.store(key, output_path, {})
+
+    # Simulate another process evicting the entry between the lookup and the copy
+    real_copyfile = result_cache.shutil.copyfile
+
+    def evict_then_copy(source, destination):
+        os.remove(source)
+        return real_copyfile(source, destination)
+
+    monkeypatch.setattr(result_cache.shutil, 'copyfile', evict_then_copy)
+
+    assert cache.fetch(key, str(tmp_path / 'copy.wav')) is None
+    assert (cache.hits, cache.misses) == (0, 1)
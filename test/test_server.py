@@ -0,0 +1,60 @@
+import importlib
+import os
+import signal
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import numpy as np
+
+server = importlib.import_module('wav-editor.core.server')
+main = importlib.import_module('wav-editor.core.main')
+audio_buffer = importlib.import_module('wav-editor.utils.audio_buffer')
+wav_writer = importlib.import_module('wav-editor.utils.wav_writer')
+
+
+def test_job_runs_after_worker_process_dies(tmp_path):
+    input_path = str(tmp_path / 'input.wav')
+    output_path = str(tmp_path / 'output.wav')
+    samples = np.arange(-500, 500, dtype=np.int16)
+    wav_writer.write_audio_buffer(input_path, audio_buffer.AudioBuffer(samples, 8000, 16))
+
+    job_queue = server.JobQueue(workers=1, max_pending=4)
+    try:
+        worker_pid = job_queue.executor.submit(server.warm_up).result()
+        os.kill(worker_pid, signal.SIGKILL)
+
+        result = job_queue.submit([input_path, output_path, '--amplify', '1.5'])
+
+        assert result['ok'], result['log']
+        assert os.path.exists(output_path)
+        assert job_queue.status()['pool_restarts'] == 1
+    finally:
+        job_queue.shutdown()
+
+
+class FakeProcessor:
+    def __init__(self):
+        self.buffer = SimpleNamespace(bits_per_sample=16)
+        self.estimates = 0
+
+    def estimate_noise_profile(self, noise, fft_size, hop_size):
+        self.estimates += 1
+        return noise
+
+
+def test_noise_profiles_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, 'MAX_NOISE_PROFILES', 2)
+    processor = FakeProcessor()
+    noise_profiles = OrderedDict()
+
+    for name in ('a', 'b', 'c'):
+        (tmp_path / f'{name}.wav').touch()
+
+    for name in ('a', 'b', 'a', 'c', 'a'):
+        path = str(tmp_path / f'{name}.wav')
+        args = SimpleNamespace(noise_pattern=path, fft_size=256, hop_size=64)
+        main.get_noise_profile(processor, args, name, noise_profiles)
+
+    # 'a' stays cached because it was used more recently than 'b'
+    assert [os.path.basename(key[0]) for key in noise_profiles] == ['c.wav', 'a.wav']
+    assert processor.estimates == 3
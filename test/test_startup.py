@@ -0,0 +1,72 @@
+import importlib
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+audio_buffer = importlib.import_module('wav-editor.utils.audio_buffer')
+wav_writer = importlib.import_module('wav-editor.utils.wav_writer')
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# Modules that must not be imported unless the feature using them is requested
+LAZY_MODULES = ('matplotlib',)
+
+# Wall-clock limits are machine dependent, so they are only checked on request
+CHECK_TIMINGS = os.environ.get('WAV_EDITOR_STARTUP_LIMITS') == '1'
+REPEATS = 5
+
+
+def run_cli(cli_args):
+    """
+    Run the CLI in a fresh interpreter with import timing enabled.
+
+    Returns:
+        Tuple of (wall time in seconds, set of imported top-level module names)
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [SRC_DIR, env.get('PYTHONPATH')]))
+    command = [sys.executable, '-X', 'importtime', '-m', 'wav-editor.core.main'] + cli_args
+
+    start_time = time.perf_counter()
+    result = subprocess.run(command, env=env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start_time
+    assert result.returncode == 0, result.stderr
+
+    # -X importtime lines look like "import time: self | cumulative | module"
+    imported = set()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            module = line.rsplit('|', 1)[1].strip()
+            imported.add(module.split('.')[0])
+    return elapsed, imported
+
+
+@pytest.fixture
+def amplify_args(tmp_path):
+    input_path = str(tmp_path / 'input.wav')
+    samples = (np.sin(np.arange(4410) * 0.1) * 10000).astype(np.int16)
+    wav_writer.write_audio_buffer(input_path, audio_buffer.AudioBuffer(samples, 44100, 16))
+    return [input_path, str(tmp_path / 'output.wav'), '--amplify', '1.5']
+
+
+@pytest.mark.parametrize('name, max_seconds', [('help', 0.5), ('amplify', 1.0)])
+def test_startup(name, max_seconds, amplify_args):
+    cli_args = ['--help'] if name == 'help' else amplify_args
+
+    timings = []
+    for _ in range(REPEATS if CHECK_TIMINGS else 1):
+        elapsed, imported = run_cli(cli_args)
+        timings.append(elapsed)
+        leaked = [module for module in LAZY_MODULES if module in imported]
+        assert not leaked, f"{name} imported {', '.join(leaked)}, which should be loaded lazily"
+
+    if CHECK_TIMINGS:
+        median = statistics.median(timings)
+        assert median <= max_seconds, \
+            f"{name} startup took {median * 1000:.1f} ms (limit {max_seconds * 1000:.0f} ms)"
@@ -0,0 +1,121 @@
+import importlib
+import os
+import struct
+
+import numpy as np
+
+wav_index = importlib.import_module('wav-editor.utils.wav_index')
+wav_reader = importlib.import_module('wav-editor.utils.wav_reader')
+audio_buffer = importlib.import_module('wav-editor.utils.audio_buffer')
+wav_writer = importlib.import_module('wav-editor.utils.wav_writer')
+
+
+def write_test_file(path, num_frames=800, sample_rate=8000):
+    samples = np.zeros(num_frames, dtype=np.int16)
+    wav_writer.write_audio_buffer(str(path), audio_buffer.AudioBuffer(samples, sample_rate, 16))
+
+
+def write_extensible_file(path, num_frames, sample_rate=48000, num_channels=2):
+    """Write a 16-bit WAVE_FORMAT_EXTENSIBLE file with a LIST chunk before the data."""
+    block_align = num_channels * 2
+    fmt = struct.pack('<HHIIHH', 0xFFFE, num_channels, sample_rate,
+                      sample_rate * block_align, block_align, 16)
+    # cbSize, valid bits, channel mask and the PCM sub-format GUID
+    fmt += struct.pack('<HHI', 22, 16, 0x3) + b'\x01\x00\x00\x00\x00\x00\x10\x00' \
+        + b'\x80\x00\x00\xaa\x00\x38\x9b\x71'
+    list_chunk = b'INFOISFT' + struct.pack('<I', 4) + b'test'
+    data = bytes(num_frames * block_align)
+
+    body = (b'WAVE' + b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+            + b'LIST' + struct.pack('<I', len(list_chunk)) + list_chunk
+            + b'data' + struct.pack('<I', len(data)) + data)
+    with open(path, 'wb') as file:
+        file.write(b'RIFF' + struct.pack('<I', len(body)) + body)
+
+
+def test_probe_skips_chunks_before_data(tmp_path):
+    path = str(tmp_path / 'extensible.wav')
+    write_extensible_file(path, num_frames=24000)
+
+    header = wav_reader.probe_wav_file(path)
+
+    assert header['audio_format'] == 0xFFFE
+    assert header['num_channels'] == 2
+    assert header['num_frames'] == 24000
+    assert header['duration'] == 0.5
+
+
+def test_second_run_reports_files_unchanged(tmp_path):
+    root = tmp_path / 'library'
+    root.mkdir()
+    for name in ('a.wav', 'b.wav', 'c.wav'):
+        write_test_file(root / name)
+    db_path = str(tmp_path / 'index.sqlite')
+
+    assert wav_index.update_index(db_path, str(root)) == {'probed': 3, 'unchanged': 0, 'removed': 0}
+    assert wav_index.update_index(db_path, str(root)) == {'probed': 0, 'unchanged': 3, 'removed': 0}
+
+
+def test_changed_file_is_probed_again(tmp_path):
+    root = tmp_path / 'library'
+    root.mkdir()
+    write_test_file(root / 'a.wav')
+    write_test_file(root / 'b.wav')
+    db_path = str(tmp_path / 'index.sqlite')
+    wav_index.update_index(db_path, str(root))
+
+    # Same size, new mtime
+    stat = os.stat(root / 'a.wav')
+    os.utime(root / 'a.wav', (stat.st_atime, stat.st_mtime + 10))
+    # New size
+    write_test_file(root / 'b.wav', num_frames=1600)
+
+    assert wav_index.update_index(db_path, str(root)) == {'probed': 2, 'unchanged': 0, 'removed': 0}
+    durations = {os.path.basename(row['path']): row['duration']
+                 for row in wav_index.query_index(db_path)}
+    assert durations == {'a.wav': 0.1, 'b.wav': 0.2}
+
+
+def test_deleted_file_is_removed_and_other_roots_are_kept(tmp_path):
+    root = tmp_path / 'library'
+    # Shares the prefix "library" but is not below root
+    other_root = tmp_path / 'library2'
+    root.mkdir()
+    other_root.mkdir()
+    write_test_file(root / 'a.wav')
+    write_test_file(root / 'b.wav')
+    write_test_file(other_root / 'c.wav')
+    db_path = str(tmp_path / 'index.sqlite')
+    wav_index.update_index(db_path, str(root))
+    wav_index.update_index(db_path, str(other_root))
+
+    os.remove(root / 'b.wav')
+
+    assert wav_index.update_index(db_path, str(root)) == {'probed': 0, 'unchanged': 1, 'removed': 1}
+    paths = [os.path.relpath(row['path'], tmp_path) for row in wav_index.query_index(db_path)]
+    assert paths == [os.path.join('library', 'a.wav'), os.path.join('library2', 'c.wav')]
+
+
+def test_invalid_files_are_indexed_with_error(tmp_path):
+    root = tmp_path / 'library'
+    root.mkdir()
+    write_test_file(root / 'good.wav')
+    with open(root / 'good.wav', 'rb') as file:
+        header = file.read(20)
+    (root / 'truncated.wav').write_bytes(header)
+    (root / 'text.wav').write_bytes(b'not a wav file')
+    db_path = str(tmp_path / 'index.sqlite')
+
+    assert wav_index.update_index(db_path, str(root))['probed'] == 3
+
+    connection = wav_index.open_index(db_path)
+    try:
+        errors = dict(connection.execute("SELECT path, error FROM wav_files"))
+    finally:
+        connection.close()
+    assert errors[str(root / 'good.wav')] is None
+    assert errors[str(root / 'truncated.wav')]
+    assert errors[str(root / 'text.wav')]
+
+    paths = [row['path'] for row in wav_index.query_index(db_path)]
+    assert paths == [str(root / 'good.wav')]